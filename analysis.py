@@ -1,18 +1,49 @@
+"""Helpers to aggregate CodeCarbon reports and rank experiments.
+
+Accuracy and model names are parsed from free-form experiment text. The
+patterns avoid backreferences and lookaround, so when the optional
+`google-re2` package is installed they run on RE2's linear-time engine;
+otherwise the standard library `re` module is used.
+
+The two engines can disagree on non-ASCII text: RE2 treats only ASCII
+characters as word characters for `\\b`, while `re` uses Unicode. For
+example, "acc=0.9 éllama" yields the model "llama" under RE2 but falls
+back to the raw name under `re`.
+"""
+
 from __future__ import annotations
 
-import re
+import functools
+from collections.abc import Iterable
 from typing import Any
 
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
 
-_ACCURACY_PATTERNS = (
-    r"(?:accuracy|acc|precision|f1|score)\s*[:=]\s*(\d+(?:[.,]\d+)?)\s*%?",
-    r"(\d+(?:[.,]\d+)?)\s*%\s*(?:accuracy|acc|precision|f1|score)",
+# Upper bound on memoized extraction results; keeps memory flat for
+# organizations with many experiments while covering typical projects.
+_EXTRACT_CACHE_SIZE = 4096
+
+# Accuracy patterns are tried in priority order: an explicit "key: value"
+# anywhere in the text wins over an earlier "N% key". Case-insensitivity is
+# set inline with (?i) because `re2.compile` takes an options object rather
+# than `re`-style flags.
+_ACC_PATTERNS = (
+    _re.compile(r"(?i)(?:accuracy|acc|precision|f1|score)\s*[:=]\s*(\d+(?:[.,]\d+)?)\s*%?"),
+    _re.compile(r"(?i)(\d+(?:[.,]\d+)?)\s*%\s*(?:accuracy|acc|precision|f1|score)"),
 )
 
+# Model patterns are tried in priority order rather than merged into one
+# alternation: an explicit "model=..." key must win over a llama or mistral
+# name appearing earlier in the text. Each is paired with a lowercase
+# keyword that every match must contain, so misses skip the regex.
 _MODEL_PATTERNS = (
-    r"(?:model|model_name)\s*[:=]\s*([A-Za-z0-9._\-/]+)",
-    r"\b(llama[0-9.\-a-zA-Z]*)\b",
-    r"\b(mistral[0-9.\-a-zA-Z]*)\b",
+    ("model", _re.compile(r"(?i)(?:model|model_name)\s*[:=]\s*([A-Za-z0-9._\-/]+)")),
+    ("llama", _re.compile(r"(?i)\b(llama[0-9.\-a-zA-Z]*)\b")),
+    ("mistral", _re.compile(r"(?i)\b(mistral[0-9.\-a-zA-Z]*)\b")),
 )
 
 
@@ -33,12 +64,53 @@ def normalize_accuracy(value: float) -> float:
     return value
 
 
+def _has_accuracy_keyword(text: str) -> bool:
+    """Return whether `text` contains a keyword every accuracy form needs."""
+    # "acc" also covers "accuracy"; a substring check is far cheaper than
+    # running the regex
+    lowered = text.lower()
+    return (
+        "acc" in lowered
+        or "f1" in lowered
+        or "score" in lowered
+        or "precision" in lowered
+    )
+
+
+def _accuracy_from_match(match: Any) -> float:
+    """Convert a match of one of `_ACC_PATTERNS` to a decimal accuracy."""
+    # Normalize European-style decimal commas before converting to float
+    value = float(match.group(1).replace(",", "."))
+    # Inlined `normalize_accuracy`; keep the two in sync
+    return value / 100.0 if value > 1 else value
+
+
+def _extract_accuracy_impl(text: str | None) -> float | None:
+    """Uncached implementation of `extract_accuracy`."""
+    if not text or not _has_accuracy_keyword(text):
+        return None
+
+    for pattern in _ACC_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return _accuracy_from_match(match)
+
+    return None
+
+
+@functools.lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
 def extract_accuracy(text: str | None) -> float | None:
     """Parse an accuracy value from a free-form text string.
 
-    Tries a set of regex patterns that cover common formats such as
-    "accuracy: 92.1", "acc=0.91", or "91% f1". Returns the first match
-    found, normalized to the [0, 1] range via `normalize_accuracy`.
+    Scans for common formats such as "accuracy: 92.1", "acc=0.91", or
+    "91% f1". A "key: value" form anywhere in the text takes precedence
+    over a percentage form; within a form the leftmost match wins. The value
+    is normalized to the [0, 1] range via `normalize_accuracy`.
+
+    Results are memoized per input string, so repeated selections over the
+    same experiments skip the regex entirely. Callers parsing very
+    high-cardinality text that will not repeat should use
+    `_extract_accuracy_impl` to avoid evicting useful entries.
 
     Args:
         text: Any string that may contain an accuracy metric, e.g. an
@@ -48,25 +120,80 @@ def extract_accuracy(text: str | None) -> float | None:
     Returns:
         Accuracy as a decimal in [0, 1], or None if no match is found.
     """
-    if not text:
+    return _extract_accuracy_impl(text)
+
+
+@functools.lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def extract_accuracy_pair(name: str | None, description: str | None) -> float | None:
+    """Parse an accuracy value from an experiment's name and description.
+
+    Gives the same result as `extract_accuracy` on the two fields joined by a
+    space, including metrics split across them (e.g. name "resnet accuracy:"
+    with description "92"), but only builds that joined string when needed:
+    fields without an accuracy keyword are rejected up front, and a
+    "key: value" match in the name settles the result on its own. Results
+    are memoized per (name, description) pair.
+
+    Args:
+        name: Experiment name, may contain an accuracy metric.
+        description: Experiment description, may contain an accuracy metric.
+
+    Returns:
+        Accuracy as a decimal in [0, 1], or None if no match is found.
+    """
+    if not (name and description):
+        return _extract_accuracy_impl(name or description)
+
+    # A keyword cannot straddle the joining space, so without one in either
+    # field no form can match the joined text
+    if not (_has_accuracy_keyword(name) or _has_accuracy_keyword(description)):
         return None
 
-    for pattern in _ACCURACY_PATTERNS:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+    # The preferred form cannot start earlier in the joined text than a
+    # match found within the name alone, so that match is the final answer
+    match = _ACC_PATTERNS[0].search(name)
+    if match:
+        return _accuracy_from_match(match)
+
+    return _extract_accuracy_impl(f"{name} {description}")
+
+
+def _extract_model_name_impl(name: str | None, description: str | None) -> str | None:
+    """Uncached implementation of `extract_model_name`."""
+    # Combine name and description into a single searchable string, skipping
+    # empty values; explicit branches avoid building a list for join()
+    if name and description:
+        text = name + " " + description
+    elif name:
+        text = name
+    elif description:
+        text = description
+    else:
+        return None
+
+    lowered = text.lower()
+    for keyword, pattern in _MODEL_PATTERNS:
+        # Skip the regex when its anchoring keyword cannot be present
+        if keyword not in lowered:
+            continue
+        match = pattern.search(text)
         if match:
-            # Normalize European-style decimal commas before converting to float
-            raw = match.group(1).replace(",", ".")
-            return normalize_accuracy(float(raw))
+            return match.group(1)
 
-    return None
+    # No pattern matched — fall back to the raw name rather than returning nothing
+    return name
 
 
+@functools.lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
 def extract_model_name(name: str | None, description: str | None) -> str | None:
     """Infer a model name from an experiment's name and description.
 
-    Searches the combined text for known model name patterns (e.g. llama,
-    mistral) or an explicit "model=..." key. Falls back to returning the raw
-    `name` argument if no pattern matches.
+    Searches the combined text for an explicit "model=..." key first, then
+    for known model name patterns (llama, then mistral), so an explicit key
+    wins wherever it appears. Falls back to returning the raw `name`
+    argument if no pattern matches. Results are memoized per
+    (name, description) pair; see `_extract_model_name_impl` for the
+    uncached variant.
 
     Args:
         name: Experiment name, may contain a model identifier.
@@ -76,28 +203,19 @@ def extract_model_name(name: str | None, description: str | None) -> str | None:
         The extracted model name string, the raw `name` as a fallback, or
         None if both inputs are empty.
     """
-    # Combine name and description into a single searchable string, skipping None values
-    text = " ".join([x for x in (name, description) if x])
-    if not text:
-        return None
-
-    for pattern in _MODEL_PATTERNS:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
-        if match:
-            return match.group(1)
-
-    # No pattern matched — fall back to the raw name rather than returning nothing
-    return name
+    return _extract_model_name_impl(name, description)
 
 
-def aggregate_run_summaries(run_reports: list[dict[str, Any]]) -> dict[str, Any]:
+def aggregate_run_summaries(run_reports: Iterable[dict[str, Any]]) -> dict[str, Any]:
     """Aggregate emissions and resource usage across a list of run reports.
 
     Sums the emissions, energy consumption, and duration for all runs belonging
-    to a single experiment. Missing or null fields are treated as zero.
+    to a single experiment. Missing or null fields are treated as zero. The
+    reports are consumed in a single pass, so any iterable (including a
+    generator) is accepted.
 
     Args:
-        run_reports: List of run report dicts, each expected to contain
+        run_reports: Iterable of run report dicts, each expected to contain
             "emissions", "energy_consumed", and "duration" keys.
 
     Returns:
@@ -107,19 +225,79 @@ def aggregate_run_summaries(run_reports: list[dict[str, Any]]) -> dict[str, Any]
             - energy_kwh: Total energy consumed in kilowatt-hours.
             - duration_seconds: Total wall-clock duration in seconds.
     """
-    emissions = sum(float(item.get("emissions") or 0.0) for item in run_reports)
-    energy_consumed = sum(
-        float(item.get("energy_consumed") or 0.0) for item in run_reports
-    )
-    duration = sum(float(item.get("duration") or 0.0) for item in run_reports)
+    # Single pass over the runs, accumulating all three totals together
+    run_count = 0
+    emissions = energy_consumed = duration = 0.0
+    for item in run_reports:
+        run_count += 1
+        emissions += float(item.get("emissions") or 0.0)
+        energy_consumed += float(item.get("energy_consumed") or 0.0)
+        duration += float(item.get("duration") or 0.0)
     return {
-        "run_count": len(run_reports),
+        "run_count": run_count,
         "emissions_kg_co2e": emissions,
         "energy_kwh": energy_consumed,
         "duration_seconds": duration,
     }
 
 
+def _build_candidate(report: dict[str, Any]) -> dict[str, Any]:
+    """Shape an experiment report into the public candidate dict."""
+    name = report.get("name")
+    description = report.get("description")
+    return {
+        "experiment_id": report.get("experiment_id"),
+        "name": name,
+        "description": description,
+        "model": extract_model_name(name, description),
+        "accuracy": extract_accuracy_pair(name, description),
+        "emissions_kg_co2e": float(report.get("emissions") or 0.0),
+        "energy_kwh": float(report.get("energy_consumed") or 0.0),
+        "duration_seconds": float(report.get("duration") or 0.0),
+    }
+
+
+def _find_lowest_consumption(
+    experiment_reports: list[dict[str, Any]],
+    threshold: float | None,
+) -> tuple[dict[str, Any] | None, int]:
+    """Find the lowest-consumption eligible report in a single pass.
+
+    Returns:
+        A (report, candidate_count) tuple; report is None when no experiment
+        is eligible.
+    """
+    # Track the running lexicographic minimum instead of materializing every
+    # candidate; strict comparison keeps the first experiment on ties
+    best_report = None
+    best_key = None
+    candidate_count = 0
+    # Bind the hot-loop callables to locals to skip repeated global and
+    # attribute lookups per experiment
+    get_accuracy = extract_accuracy_pair
+    for report in experiment_reports:
+        get = report.get
+        # Skip experiments that don't meet the accuracy bar; if no threshold is
+        # set, all experiments are eligible and accuracy is never parsed here
+        if threshold is not None:
+            # Accuracy is parsed from free-form text rather than a dedicated field
+            accuracy = get_accuracy(get("name"), get("description"))
+            if accuracy is None or accuracy < threshold:
+                continue
+
+        candidate_count += 1
+        key = (
+            float(get("emissions") or 0.0),
+            float(get("energy_consumed") or 0.0),
+            float(get("duration") or 0.0),
+        )
+        if best_key is None or key < best_key:
+            best_key = key
+            best_report = report
+
+    return best_report, candidate_count
+
+
 def select_lowest_consumption_experiment(
     experiment_reports: list[dict[str, Any]],
     min_accuracy: float | None = None,
@@ -152,31 +330,14 @@ def select_lowest_consumption_experiment(
         normalize_accuracy(min_accuracy) if min_accuracy is not None else None
     )
 
-    candidates = []
-    for report in experiment_reports:
-        # Accuracy is parsed from free-form text rather than a dedicated field
-        accuracy = extract_accuracy(
-            f"{report.get('name', '')} {report.get('description', '')}"
-        )
-        emissions = float(report.get("emissions") or 0.0)
-        candidate = {
-            "experiment_id": report.get("experiment_id"),
-            "name": report.get("name"),
-            "description": report.get("description"),
-            "model": extract_model_name(report.get("name"), report.get("description")),
-            "accuracy": accuracy,
-            "emissions_kg_co2e": emissions,
-            "energy_kwh": float(report.get("energy_consumed") or 0.0),
-            "duration_seconds": float(report.get("duration") or 0.0),
-        }
-        # Skip experiments that don't meet the accuracy bar; if no threshold is
-        # set, all experiments are eligible regardless of parsed accuracy
-        if normalized_threshold is None or (
-            accuracy is not None and accuracy >= normalized_threshold
-        ):
-            candidates.append(candidate)
+    # Accuracy and model are only parsed during ranking when a threshold
+    # needs them; the selected report is enriched once at the end, where
+    # the memoized extractors make a repeat parse free
+    best_report, candidate_count = _find_lowest_consumption(
+        experiment_reports, normalized_threshold
+    )
 
-    if not candidates:
+    if best_report is None:
         return {
             "selected": None,
             "min_accuracy": normalized_threshold,
@@ -184,16 +345,8 @@ def select_lowest_consumption_experiment(
             "message": "No experiment matches the requested minimum accuracy.",
         }
 
-    selected = min(
-        candidates,
-        key=lambda c: (
-            c["emissions_kg_co2e"],
-            c["energy_kwh"],
-            c["duration_seconds"],
-        ),
-    )
     return {
-        "selected": selected,
+        "selected": _build_candidate(best_report),
         "min_accuracy": normalized_threshold,
-        "candidate_count": len(candidates),
-    }
\ No newline at end of file
+        "candidate_count": candidate_count,
+    }
@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Any
 
-import requests
+import httpx
+import orjson
+
+
+def _date_params(
+    start_date: str | None, end_date: str | None
+) -> dict[str, str] | None:
+    """Build the optional date-window query parameters, or None if unset."""
+    if not (start_date or end_date):
+        return None
+    return {
+        key: value
+        for key, value in (("start_date", start_date), ("end_date", end_date))
+        if value
+    }
 
 
 class CodeCarbonApiError(RuntimeError):
@@ -16,104 +32,235 @@ class CodeCarbonApiClient:
         api_token: str | None = None,
         access_token: str | None = None,
         timeout_seconds: int = 20,
+        cache_ttl_seconds: float = 60.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
         self.access_token = access_token
         self.timeout_seconds = timeout_seconds
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # Listing responses keyed by path: (expires_at, etag, decoded body)
+        self._cache: dict[str, tuple[float, str | None, Any]] = {}
+        # Lowercased-name indexes, keyed by project id and tied to the exact
+        # experiment list object they were built from
+        self._name_indexes: dict[str, tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]] = {}
+        # A persistent async client keeps TCP/TLS connections alive across
+        # calls and lets independent requests run concurrently. Redirects are
+        # followed, as they were with `requests`, so a 3xx is never mistaken
+        # for an empty successful response
+        self._http = httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            follow_redirects=True,
+            transport=transport,
+        )
+        # Tokens are fixed at construction (see set_token), so the auth
+        # headers are built once rather than on every request
+        self._cached_headers = self._build_headers()
 
-    def _headers(self) -> dict[str, str]:
-        headers = {"Content-Type": "application/json"}
+    async def __aenter__(self) -> CodeCarbonApiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections held by this client."""
+        await self._http.aclose()
+
+    def set_token(
+        self, api_token: str | None = None, access_token: str | None = None
+    ) -> None:
+        """Replace the credentials used for subsequent requests."""
+        self.api_token = api_token
+        self.access_token = access_token
+        self._cached_headers = self._build_headers()
+        # Cached listings belong to the previous identity
+        self.invalidate_cache()
+
+    def invalidate_cache(self, path: str | None = None) -> None:
+        """Drop one cached listing by API path, or all of them."""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+    def _build_headers(self) -> dict[str, str]:
+        headers = {}
         if self.api_token:
             headers["x-api-token"] = self.api_token
         elif self.access_token:
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
 
-    def _request(
-        self, method: str, path: str, params: dict[str, Any] | None = None, json: dict[str, Any] | None = None
-    ) -> Any:
+    def _headers(self) -> dict[str, str]:
+        return self._cached_headers
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
         url = f"{self.base_url}{path}"
-        response = requests.request(
+        response = await self._http.request(
             method=method,
             url=url,
-            headers=self._headers(),
+            headers=headers if headers is not None else self._headers(),
             params=params,
             json=json,
-            timeout=self.timeout_seconds,
         )
         if response.status_code >= 400:
             raise CodeCarbonApiError(
                 f"{method} {path} failed ({response.status_code}): {response.text}"
             )
+        return response
+
+    async def _request(
+        self, method: str, path: str, params: dict[str, Any] | None = None, json: dict[str, Any] | None = None
+    ) -> Any:
+        response = await self._send(method, path, params=params, json=json)
         if response.content:
-            return response.json()
+            return orjson.loads(response.content)
         return None
 
-    def check_auth(self) -> dict[str, Any]:
-        return self._request("GET", "/auth/check")
+    async def _cached_get(self, path: str) -> Any:
+        """GET a listing, serving it from cache while fresh.
+
+        Within the TTL the cached body is returned without a request. Once
+        stale, the stored ETag is sent as If-None-Match so an unchanged
+        listing comes back as 304 and is reused without decoding a body.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(path)
+        if entry is not None and now < entry[0]:
+            return entry[2]
+
+        headers = self._headers()
+        if entry is not None and entry[1]:
+            headers = {**headers, "If-None-Match": entry[1]}
+        response = await self._send("GET", path, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            etag, data = entry[1], entry[2]
+        else:
+            etag = response.headers.get("ETag")
+            data = orjson.loads(response.content) if response.content else None
+        self._cache[path] = (now + self.cache_ttl_seconds, etag, data)
+        return data
+
+    async def check_auth(self) -> dict[str, Any]:
+        return await self._request("GET", "/auth/check")
 
-    def list_organizations(self) -> list[dict[str, Any]]:
-        return self._request("GET", "/organizations")
+    async def list_organizations(self) -> list[dict[str, Any]]:
+        return await self._cached_get("/organizations")
 
-    def list_projects(self, organization_id: str) -> list[dict[str, Any]]:
-        return self._request("GET", f"/organizations/{organization_id}/projects")
+    async def list_projects(self, organization_id: str) -> list[dict[str, Any]]:
+        return await self._cached_get(f"/organizations/{organization_id}/projects")
 
-    def get_project(self, project_id: str) -> dict[str, Any]:
-        return self._request("GET", f"/projects/{project_id}")
+    async def get_project(self, project_id: str) -> dict[str, Any]:
+        return await self._request("GET", f"/projects/{project_id}")
 
-    def list_experiments(self, project_id: str) -> list[dict[str, Any]]:
-        return self._request("GET", f"/projects/{project_id}/experiments")
+    async def list_experiments(self, project_id: str) -> list[dict[str, Any]]:
+        return await self._cached_get(f"/projects/{project_id}/experiments")
 
-    def get_experiment(self, experiment_id: str) -> dict[str, Any]:
-        return self._request("GET", f"/experiments/{experiment_id}")
+    async def list_experiments_by_name(
+        self, project_id: str
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the project's experiments grouped by stripped, lowercased name.
 
-    def get_experiment_run_summaries(
+        The index is rebuilt only when the cached experiment listing changes.
+        """
+        experiments = await self.list_experiments(project_id)
+        cached = self._name_indexes.get(project_id)
+        if cached is not None and cached[0] is experiments:
+            return cached[1]
+
+        index: dict[str, list[dict[str, Any]]] = {}
+        for experiment in experiments:
+            key = (experiment.get("name") or "").strip().lower()
+            index.setdefault(key, []).append(experiment)
+        self._name_indexes[project_id] = (experiments, index)
+        return index
+
+    async def get_experiment(self, experiment_id: str) -> dict[str, Any]:
+        return await self._request("GET", f"/experiments/{experiment_id}")
+
+    async def get_experiment_run_summaries(
         self,
         experiment_id: str,
         start_date: str | None = None,
         end_date: str | None = None,
     ) -> list[dict[str, Any]]:
-        params = {}
-        if start_date:
-            params["start_date"] = start_date
-        if end_date:
-            params["end_date"] = end_date
-        return self._request(
-            "GET", f"/experiments/{experiment_id}/runs/sums", params=params or None
+        return await self._request(
+            "GET",
+            f"/experiments/{experiment_id}/runs/sums",
+            params=_date_params(start_date, end_date),
         )
 
-    def get_project_experiment_summaries(
+    async def get_project_experiment_summaries(
         self,
         project_id: str,
         start_date: str | None = None,
         end_date: str | None = None,
     ) -> list[dict[str, Any]]:
-        params = {}
-        if start_date:
-            params["start_date"] = start_date
-        if end_date:
-            params["end_date"] = end_date
-        return self._request(
-            "GET", f"/projects/{project_id}/experiments/sums", params=params or None
+        return await self._request(
+            "GET",
+            f"/projects/{project_id}/experiments/sums",
+            params=_date_params(start_date, end_date),
         )
 
-    def get_run(self, run_id: str) -> dict[str, Any]:
-        return self._request("GET", f"/runs/{run_id}")
+    async def get_run(self, run_id: str) -> dict[str, Any]:
+        return await self._request("GET", f"/runs/{run_id}")
 
-    def get_run_emissions(
+    async def get_run_emissions(
         self,
         run_id: str,
         page: int = 1,
         page_size: int = 1000,
     ) -> dict[str, Any]:
-        return self._request(
+        return await self._request(
             "GET",
             f"/runs/{run_id}/emissions",
             params={"page": page, "size": page_size},
         )
 
-    def create_experiment(
+    async def get_all_run_emissions(
+        self,
+        run_id: str,
+        page_size: int = 1000,
+        max_concurrency: int = 8,
+    ) -> list[dict[str, Any]]:
+        """Fetch every emission record of a run across all pages.
+
+        The first page is fetched to discover the page count; the remaining
+        pages are then requested concurrently over the shared connection pool.
+        """
+        first_page = await self.get_run_emissions(run_id, page=1, page_size=page_size)
+        items = list(first_page.get("items") or [])
+        last_page = first_page.get("pages")
+        if last_page is None:
+            total = first_page.get("total") or 0
+            last_page = -(-total // page_size)
+        if last_page <= 1:
+            return items
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_run_emissions(run_id, page=page, page_size=page_size)
+
+        # gather preserves argument order, so pages are concatenated in order
+        pages = await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1)))
+        for page in pages:
+            items.extend(page.get("items") or [])
+        return items
+
+    async def create_experiment(
         self,
         project_id: str,
         name: str,
@@ -148,4 +295,7 @@ class CodeCarbonApiClient:
         if cloud_region is not None:
             payload["cloud_region"] = cloud_region
 
-        return self._request("POST", "/experiments", json=payload)
\ No newline at end of file
+        experiment = await self._request("POST", "/experiments", json=payload)
+        # The project's experiment listing is now out of date
+        self.invalidate_cache(f"/projects/{project_id}/experiments")
+        return experiment
\ No newline at end of file
@@ -10,31 +10,130 @@ projects, experiments, and recommendations).
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Any, TypedDict
 from datetime import datetime
 import logging
+import threading
+import time
 
+import orjson
 from mcp.server.fastmcp import FastMCP
-from codecarbon import EmissionsTracker
-from analysis import aggregate_run_summaries, select_lowest_consumption_experiment
-from client import CodeCarbonApiClient
+from mcp.server.fastmcp.tools import Tool
+
+# codecarbon (and to a lesser degree analysis/client) are imported inside the
+# tools that use them, so spawning the server does not pay for loading them
+if TYPE_CHECKING:
+    from codecarbon import EmissionsTracker
+    from client import CodeCarbonApiClient
 
 # Initialize the MCP server
 mcp = FastMCP("codecarbon")
 
-# Global tracker for local energy tracking
-tracker: Optional[EmissionsTracker] = None
-start_time: Optional[datetime] = None
+# CodeCarbon project name used for local tracking sessions
+_TRACKING_PROJECT_NAME = "mcp-codecarbon-tracking"
+
+
+@dataclass(frozen=True, slots=True)
+class _TrackingSession:
+    """State of an active local tracking session."""
+
+    tracker: EmissionsTracker
+    # Monotonic clock reading at start, used for durations so they are
+    # immune to wall-clock adjustments
+    start_monotonic: float
+    # ISO 8601 start timestamp, rendered once since every status poll
+    # reports it
+    start_iso: str
+
+
+# Active local tracking session, if any. A plain global rather than a
+# ContextVar: each MCP request runs in its own task context, so a session
+# set by start_tracking would not be visible to later tool calls.
+_session: Optional[_TrackingSession] = None
+# Serializes start/stop so the tracker is never created or torn down twice
+_tracker_lock = asyncio.Lock()
+
+# Shared API client, reused across tool calls until the credentials file changes
+_CREDENTIALS_FILE = "credentials.json"
+_client_lock = threading.Lock()
+_client_cache: Optional[CodeCarbonApiClient] = None
+_client_mtime: Optional[int] = None
+# Number of tool calls currently using each client, so a client replaced
+# after a re-login is only closed once the calls still holding it finish
+_client_leases: dict[CodeCarbonApiClient, int] = {}
+# Strong references to pending close tasks so they are not collected early
+_closing_tasks: set[asyncio.Task[None]] = set()
+
+
+# ---------------------------------------------------------------------------
+# Local tracking response payloads
+# ---------------------------------------------------------------------------
+
+# Optional keys live in `total=False` subclasses: with postponed annotations
+# `NotRequired[...]` stays a string and TypedDict would treat it as required.
+class _TrackingStatus(TypedDict):
+    """Key present in every tracking tool payload."""
+
+    status: str
+
+
+class StartTrackingResponse(_TrackingStatus, total=False):
+    """Payload returned by `start_tracking`."""
+
+    start_time: str
+    project_name: str
+    measurement_interval: int
+    message: str
+
+
+class StopTrackingResponse(TypedDict):
+    """Payload returned by `stop_tracking`."""
+
+    status: str
+    duration_seconds: float
+    emissions_kg_co2: Optional[float]
+
+
+class StatusResponse(_TrackingStatus, total=False):
+    """Payload returned by `get_status`."""
+
+    start_time: Optional[str]
+
+
+class MetricsResponse(TypedDict):
+    """Payload returned by `get_current_metrics`."""
+
+    status: str
+    start_time: str
+    current_time: str
+    duration_seconds: float
 
 
 # ---------------------------------------------------------------------------
 # Local tracking tools
 # ---------------------------------------------------------------------------
 
+def _create_tracker(measure_power_secs: int) -> EmissionsTracker:
+    """Import codecarbon and build a tracker for a local tracking session."""
+    # Imported here, not at module level: codecarbon pulls in pandas and the
+    # hardware probes, and this runs in a worker thread
+    from codecarbon import EmissionsTracker
+
+    return EmissionsTracker(
+        project_name=_TRACKING_PROJECT_NAME,
+        measure_power_secs=measure_power_secs,
+        log_level="info"
+    )
+
+
 @mcp.tool()
-async def start_tracking(measure_power_secs: int = 15) -> Dict[str, Any]:
+async def start_tracking(measure_power_secs: int = 15) -> StartTrackingResponse:
     """
     Start energy tracking with CodeCarbon.
 
@@ -57,38 +156,44 @@ async def start_tracking(measure_power_secs: int = 15) -> Dict[str, Any]:
             - measurement_interval (int): The power measurement interval in seconds.
                 Only present when status is 'started'.
     """
-    global tracker, start_time
-
-    if tracker is not None:
-        return {
-            "status": "already_running",
-            "message": "Tracking is already in progress."
-        }
-
-    tracker = EmissionsTracker(
-        project_name="mcp-codecarbon-tracking",
-        measure_power_secs=measure_power_secs,
-        log_level="info"
-    )
-
-    tracker.start()
-    start_time = datetime.now()
+    global _session
+
+    # Held across the awaits below so concurrent calls cannot both see no
+    # tracker and each start one
+    async with _tracker_lock:
+        if _session is not None:
+            return {
+                "status": "already_running",
+                "message": "Tracking is already in progress."
+            }
+
+        # Importing codecarbon and probing hardware can take seconds; run
+        # both off the event loop so other tools stay responsive meanwhile
+        new_tracker = await asyncio.to_thread(_create_tracker, measure_power_secs)
+
+        await asyncio.to_thread(new_tracker.start)
+        session = _TrackingSession(
+            tracker=new_tracker,
+            start_monotonic=time.monotonic(),
+            start_iso=datetime.now().isoformat(),
+        )
+        _session = session
 
     return {
         "status": "started",
-        "start_time": start_time.isoformat(),
-        "project_name": tracker._project_name,
+        "start_time": session.start_iso,
+        "project_name": _TRACKING_PROJECT_NAME,
         "measurement_interval": measure_power_secs
     }
 
 
 @mcp.tool()
-async def stop_tracking() -> Dict[str, Any]:
+async def stop_tracking() -> StopTrackingResponse:
     """
     Stop the active energy tracking session and return final metrics.
 
     Finalizes the current EmissionsTracker session, computes total
-    emissions, and clears the global tracker state.
+    emissions, and clears the active session state.
 
     Returns:
         A dict with the following keys:
@@ -101,18 +206,16 @@ async def stop_tracking() -> Dict[str, Any]:
     Raises:
         RuntimeError: If no tracking session is currently active.
     """
-    global tracker, start_time
-
-    if tracker is None:
-        raise RuntimeError("No active tracking session.")
+    global _session
 
-    emissions = tracker.stop()
-    end_time = datetime.now()
+    async with _tracker_lock:
+        session = _session
+        if session is None:
+            raise RuntimeError("No active tracking session.")
 
-    duration = (end_time - start_time).total_seconds() if start_time else 0
-
-    tracker = None
-    start_time = None
+        emissions = await asyncio.to_thread(session.tracker.stop)
+        duration = time.monotonic() - session.start_monotonic
+        _session = None
 
     return {
         "status": "stopped",
@@ -122,7 +225,7 @@ async def stop_tracking() -> Dict[str, Any]:
 
 
 @mcp.tool()
-async def get_status() -> Dict[str, Any]:
+async def get_status() -> StatusResponse:
     """
     Return the current state of the energy tracking session.
 
@@ -136,19 +239,20 @@ async def get_status() -> Dict[str, Any]:
             - start_time (str | None): ISO 8601 timestamp of when the active
                 session started. Only present when status is 'tracking'.
     """
-    if tracker is None:
+    session = _session
+    if session is None:
         return {
             "status": "not_tracking"
         }
 
     return {
         "status": "tracking",
-        "start_time": start_time.isoformat() if start_time else None
+        "start_time": session.start_iso
     }
 
 
 @mcp.tool()
-async def get_current_metrics() -> Dict[str, Any]:
+async def get_current_metrics() -> MetricsResponse:
     """
     Return timing information about the ongoing tracking session.
 
@@ -166,15 +270,16 @@ async def get_current_metrics() -> Dict[str, Any]:
     Raises:
         RuntimeError: If no tracking session is currently active.
     """
-    if tracker is None or start_time is None:
+    session = _session
+    if session is None:
         raise RuntimeError("No active tracking session.")
 
     now = datetime.now()
-    duration = (now - start_time).total_seconds()
+    duration = time.monotonic() - session.start_monotonic
 
     return {
         "status": "tracking",
-        "start_time": start_time.isoformat(),
+        "start_time": session.start_iso,
         "current_time": now.isoformat(),
         "duration_seconds": round(duration, 2)
     }
@@ -191,6 +296,7 @@ def _get_access_token_from_file() -> str:
     Looks for a 'credentials.json' file in the current working directory,
     which is typically created by running `codecarbon login`. Parses the
     file and extracts the access token from the nested token structure.
+    The parsed token is memoized until the file's modification time changes.
 
     Returns:
         The access token string to be used for API authentication.
@@ -201,27 +307,43 @@ def _get_access_token_from_file() -> str:
         ValueError: If the credentials file exists but does not contain
             a valid 'access_token' field.
     """
-    cred_path = Path("credentials.json")
-    if not cred_path.exists():
+    cred_path = Path(_CREDENTIALS_FILE)
+    try:
+        mtime = cred_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"No credentials file found at {cred_path}. Please run `codecarbon login` first."
-        )
-    with cred_path.open("r") as f:
-        data = json.load(f)
+        ) from None
+    return _read_access_token(mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_access_token(mtime_ns: int) -> str:
+    """
+    Parse the access token out of the credentials file.
+
+    Keyed on the file's modification time so a re-login is picked up while
+    repeated reads of an unchanged file cost a single dict lookup.
+    """
+    data = orjson.loads(Path(_CREDENTIALS_FILE).read_bytes())
     try:
         return data["tokens"]["access_token"]
     except KeyError:
         raise ValueError(
             "No access_token found in credentials file. Run `codecarbon login` again."
-        )
+        ) from None
 
 
 def _build_client() -> CodeCarbonApiClient:
     """
-    Build and return an authenticated CodeCarbon API client.
+    Return an authenticated CodeCarbon API client.
 
-    Reads credentials from the local credentials file and instantiates
-    a CodeCarbonApiClient pointed at the production API endpoint.
+    The client is built from the local credentials file on first use and
+    then shared by every tool call, so its pooled HTTP connections are
+    reused. It is rebuilt whenever the credentials file's modification
+    time changes (e.g. after running `codecarbon login` again). Tool calls
+    should obtain it through `_api_client`, which keeps a replaced client
+    open until the calls still using it have finished.
 
     Returns:
         A configured CodeCarbonApiClient instance ready to make
@@ -231,13 +353,61 @@ def _build_client() -> CodeCarbonApiClient:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
+    global _client_cache, _client_mtime
+
+    from client import CodeCarbonApiClient
+
     base_url = "https://api.codecarbon.io"
-    access_token = _get_access_token_from_file()
-    return CodeCarbonApiClient(base_url=base_url, access_token=access_token)
+    with _client_lock:
+        try:
+            mtime = Path(_CREDENTIALS_FILE).stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if _client_cache is not None and mtime == _client_mtime:
+            return _client_cache
+
+        # Raises with a helpful message if the file is missing or invalid
+        access_token = _get_access_token_from_file()
+        previous = _client_cache
+        _client_cache = CodeCarbonApiClient(base_url=base_url, access_token=access_token)
+        _client_mtime = mtime
+
+    # A replaced client still leased by in-flight tool calls is closed when
+    # the last of them finishes (see _api_client); an idle one is closed now
+    if previous is not None and previous not in _client_leases:
+        task = asyncio.get_running_loop().create_task(previous.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+    return _client_cache
+
+
+@contextlib.asynccontextmanager
+async def _api_client() -> AsyncIterator[CodeCarbonApiClient]:
+    """
+    Lease the shared CodeCarbon API client for the duration of a tool call.
+
+    Yields:
+        The client returned by `_build_client`. If it is replaced while
+        leased, it is closed once every tool call holding it has finished.
+
+    Raises:
+        FileNotFoundError: If the credentials file is missing.
+        ValueError: If the credentials file lacks a valid access token.
+    """
+    client = _build_client()
+    _client_leases[client] = _client_leases.get(client, 0) + 1
+    try:
+        yield client
+    finally:
+        remaining = _client_leases.pop(client) - 1
+        if remaining:
+            _client_leases[client] = remaining
+        elif client is not _client_cache:
+            await client.aclose()
 
 
 @mcp.tool()
-def check_auth() -> dict[str, Any]:
+async def check_auth() -> dict[str, Any]:
     """
     Validate that the configured credentials can access the CodeCarbon API.
 
@@ -251,11 +421,12 @@ def check_auth() -> dict[str, Any]:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    return _build_client().check_auth()
+    async with _api_client() as client:
+        return await client.check_auth()
 
 
 @mcp.tool()
-def list_organizations() -> list[dict[str, Any]]:
+async def list_organizations() -> list[dict[str, Any]]:
     """
     List all organizations visible to the configured credentials.
 
@@ -268,11 +439,12 @@ def list_organizations() -> list[dict[str, Any]]:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    return _build_client().list_organizations()
+    async with _api_client() as client:
+        return await client.list_organizations()
 
 
 @mcp.tool()
-def list_projects(organization_id: str) -> list[dict[str, Any]]:
+async def list_projects(organization_id: str) -> list[dict[str, Any]]:
     """
     List all projects under a given organization.
 
@@ -290,11 +462,12 @@ def list_projects(organization_id: str) -> list[dict[str, Any]]:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    return _build_client().list_projects(organization_id)
+    async with _api_client() as client:
+        return await client.list_projects(organization_id)
 
 
 @mcp.tool()
-def list_experiments(project_id: str) -> list[dict[str, Any]]:
+async def list_experiments(project_id: str) -> list[dict[str, Any]]:
     """
     List all experiments under a given project.
 
@@ -313,14 +486,16 @@ def list_experiments(project_id: str) -> list[dict[str, Any]]:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    return _build_client().list_experiments(project_id)
+    async with _api_client() as client:
+        return await client.list_experiments(project_id)
 
 
 @mcp.tool()
-def get_experiment_consumption(
+async def get_experiment_consumption(
     experiment_id: str,
     start_date: str | None = None,
     end_date: str | None = None,
+    include_runs: bool = True,
 ) -> dict[str, Any]:
     """
     Return aggregated energy consumption for a specific experiment.
@@ -335,6 +510,9 @@ def get_experiment_consumption(
             Only runs on or after this date are included.
         end_date: Optional ISO 8601 date string (e.g. '2024-12-31').
             Only runs on or before this date are included.
+        include_runs: Whether to return the individual run summaries
+            alongside the totals. Set to False to keep the response small
+            when only totals are needed. Defaults to True.
 
     Returns:
         A dict with the following keys:
@@ -345,21 +523,26 @@ def get_experiment_consumption(
             - totals (dict): Aggregated consumption metrics across all
                 matching runs (e.g. total energy in kWh, total CO2 in kg).
             - runs (list[dict]): Individual run summaries used
-                for the aggregation.
+                for the aggregation. Only present when include_runs is True.
 
     Raises:
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    client = _build_client()
-    experiment = client.get_experiment(experiment_id)
-    run_summaries = client.get_experiment_run_summaries(
-        experiment_id=experiment_id,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    from analysis import aggregate_run_summaries
+
+    async with _api_client() as client:
+        # The two requests are independent, so issue them concurrently
+        experiment, run_summaries = await asyncio.gather(
+            client.get_experiment(experiment_id),
+            client.get_experiment_run_summaries(
+                experiment_id=experiment_id,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        )
     totals = aggregate_run_summaries(run_summaries)
-    return {
+    result = {
         "experiment": {
             "id": experiment.get("id"),
             "name": experiment.get("name"),
@@ -368,16 +551,19 @@ def get_experiment_consumption(
         },
         "window": {"start_date": start_date, "end_date": end_date},
         "totals": totals,
-        "runs": run_summaries,
     }
+    if include_runs:
+        result["runs"] = run_summaries
+    return result
 
 
 @mcp.tool()
-def get_experiment_consumption_by_name(
+async def get_experiment_consumption_by_name(
     project_id: str,
     experiment_name: str,
     start_date: str | None = None,
     end_date: str | None = None,
+    include_runs: bool = True,
 ) -> dict[str, Any]:
     """
     Find an experiment by name in a project and return its consumption.
@@ -395,6 +581,8 @@ def get_experiment_consumption_by_name(
             this date are included in the consumption totals.
         end_date: Optional ISO 8601 date string. Only runs on or before
             this date are included in the consumption totals.
+        include_runs: Whether to return the individual run summaries of
+            the matched experiment. Defaults to True.
 
     Returns:
         If exactly one experiment matches: the full consumption dict as
@@ -408,12 +596,14 @@ def get_experiment_consumption_by_name(
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    client = _build_client()
-    experiments = client.list_experiments(project_id)
+    async with _api_client() as client:
+        # Names are lowercased once per listing; exact match is a dict lookup and
+        # the partial fallback only scans the distinct names
+        by_name = await client.list_experiments_by_name(project_id)
     lowered = experiment_name.strip().lower()
-    exact = [exp for exp in experiments if exp.get("name", "").strip().lower() == lowered]
-    partial = [exp for exp in experiments if lowered in exp.get("name", "").strip().lower()]
-    matches = exact or partial
+    matches = by_name.get(lowered) or [
+        exp for name, exps in by_name.items() if lowered in name for exp in exps
+    ]
     if not matches:
         return {
             "message": f"No experiment found for name '{experiment_name}' in project {project_id}.",
@@ -424,13 +614,16 @@ def get_experiment_consumption_by_name(
             "message": f"Multiple experiments match '{experiment_name}'.",
             "matches": [{"id": m.get("id"), "name": m.get("name")} for m in matches],
         }
-    return get_experiment_consumption(
-        experiment_id=matches[0]["id"], start_date=start_date, end_date=end_date
+    return await get_experiment_consumption(
+        experiment_id=matches[0]["id"],
+        start_date=start_date,
+        end_date=end_date,
+        include_runs=include_runs,
     )
 
 
 @mcp.tool()
-def recommend_lowest_emission_experiment(
+async def recommend_lowest_emission_experiment(
     project_id: str,
     min_accuracy: float | None = None,
     start_date: str | None = None,
@@ -469,10 +662,12 @@ def recommend_lowest_emission_experiment(
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    client = _build_client()
-    reports = client.get_project_experiment_summaries(
-        project_id=project_id, start_date=start_date, end_date=end_date
-    )
+    from analysis import select_lowest_consumption_experiment
+
+    async with _api_client() as client:
+        reports = await client.get_project_experiment_summaries(
+            project_id=project_id, start_date=start_date, end_date=end_date
+        )
     recommendation = select_lowest_consumption_experiment(
         experiment_reports=reports,
         min_accuracy=min_accuracy,
@@ -486,7 +681,7 @@ def recommend_lowest_emission_experiment(
 
 
 @mcp.tool()
-def create_experiment(
+async def create_experiment(
     project_id: str,
     name: str,
     description: str | None = None,
@@ -536,19 +731,123 @@ def create_experiment(
         FileNotFoundError: If the credentials file is missing.
         ValueError: If the credentials file lacks a valid access token.
     """
-    client = _build_client()
-    return client.create_experiment(
-        project_id=project_id,
-        name=name,
-        description=description,
-        timestamp=timestamp,
-        country_name=country_name,
-        country_iso_code=country_iso_code,
-        region=region,
-        on_cloud=on_cloud,
-        cloud_provider=cloud_provider,
-        cloud_region=cloud_region,
+    async with _api_client() as client:
+        return await client.create_experiment(
+            project_id=project_id,
+            name=name,
+            description=description,
+            timestamp=timestamp,
+            country_name=country_name,
+            country_iso_code=country_iso_code,
+            region=region,
+            on_cloud=on_cloud,
+            cloud_provider=cloud_provider,
+            cloud_region=cloud_region,
+        )
+
+
+# Remote tools that can be fanned out through batch_execute. They are wrapped
+# as FastMCP tools so batched arguments are validated and coerced exactly as
+# in a direct tool call (e.g. "92" -> 92.0, "false" -> False).
+_BATCH_TOOLS = {
+    fn.__name__: Tool.from_function(fn)
+    for fn in (
+        check_auth,
+        list_organizations,
+        list_projects,
+        list_experiments,
+        get_experiment_consumption,
+        get_experiment_consumption_by_name,
+        recommend_lowest_emission_experiment,
+        create_experiment,
     )
+}
+
+
+@mcp.tool()
+async def batch_execute(
+    operations: list[dict[str, Any]],
+    max_concurrent: int = 8,
+    stop_on_error: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Run several remote API tools concurrently in a single call.
+
+    Collapses a chain of independent lookups (e.g. listing experiments of
+    several projects) into one MCP round trip. All operations share the
+    same pooled API client.
+
+    Args:
+        operations: List of operations, each a dict with keys:
+            - tool (str): Name of a remote API tool, e.g. 'list_experiments'.
+            - args (dict): Optional keyword arguments for that tool,
+                validated against its schema as in a direct call.
+        max_concurrent: Maximum number of operations running at once.
+            Defaults to 8.
+        stop_on_error: If True, operations that have not started yet are
+            skipped once any operation fails. Defaults to False.
+
+    Returns:
+        A list with one dict per operation, in the same order, containing:
+            - tool (str): The requested tool name.
+            - status (str): 'ok', 'error', or 'skipped'.
+            - result (Any): The tool's return value. Only present when
+                status is 'ok'.
+            - error (str): The failure reason. Only present when status
+                is 'error'.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    failed = False
+
+    async def run(operation: dict[str, Any]) -> dict[str, Any]:
+        nonlocal failed
+        name = operation.get("tool")
+        async with semaphore:
+            if failed and stop_on_error:
+                return {"tool": name, "status": "skipped"}
+            try:
+                tool = _BATCH_TOOLS.get(name)
+                if tool is None:
+                    raise ValueError(f"Unknown or non-batchable tool '{name}'.")
+                result = await tool.fn_metadata.call_fn_with_arg_validation(
+                    tool.fn, tool.is_async, operation.get("args") or {}, None
+                )
+            except Exception as exc:
+                failed = True
+                return {"tool": name, "status": "error", "error": f"{type(exc).__name__}: {exc}"}
+        return {"tool": name, "status": "ok", "result": result}
+
+    return list(await asyncio.gather(*(run(operation) for operation in operations)))
+
+
+# Static scenarios served by demo_prompt_scenarios, built once at import
+_DEMO_SCENARIOS = (
+    {
+        "title": "Experiment Consumption - Desktop Ben",
+        "prompt": "What is the consumption of my experiment 'Desktop Ben' (GTX 1080 ti)?",
+        "tool_chain": "get_experiment_consumption_by_name",
+    },
+    {
+        "title": "Experiment Consumption - Laptop",
+        "prompt": "What is the consumption of my experiment 'Laptop' (Laptop with RAPL Intel(R) Core(TM) Ultra 7 265H)?",
+        "tool_chain": "get_experiment_consumption_by_name",
+    },
+    {
+        "title": "Comparison with Accuracy Constraint",
+        "prompt": "Which model consumes the least with a minimum accuracy of 92%?",
+        "tool_chain": "recommend_lowest_emission_experiment(min_accuracy=92)",
+    },
+    {
+        "title": "Project Inventory",
+        "prompt": "List the available experiments in my project.",
+        "tool_chain": "list_experiments",
+    },
+    {
+        "title": "Create a Simple Experiment",
+        "prompt": "Create a new experiment named 'test experiment' in my project",
+        "tool_chain": "create_experiment",
+    },
+)
 
 
 @mcp.tool()
@@ -566,33 +865,7 @@ def demo_prompt_scenarios() -> list[dict[str, str]]:
             - prompt (str): A natural-language prompt a user might send.
             - tool_chain (str): The primary MCP tool invoked by the prompt.
     """
-    return [
-        {
-            "title": "Experiment Consumption - Desktop Ben",
-            "prompt": "What is the consumption of my experiment 'Desktop Ben' (GTX 1080 ti)?",
-            "tool_chain": "get_experiment_consumption_by_name",
-        },
-        {
-            "title": "Experiment Consumption - Laptop",
-            "prompt": "What is the consumption of my experiment 'Laptop' (Laptop with RAPL Intel(R) Core(TM) Ultra 7 265H)?",
-            "tool_chain": "get_experiment_consumption_by_name",
-        },
-        {
-            "title": "Comparison with Accuracy Constraint",
-            "prompt": "Which model consumes the least with a minimum accuracy of 92%?",
-            "tool_chain": "recommend_lowest_emission_experiment(min_accuracy=92)",
-        },
-        {
-            "title": "Project Inventory",
-            "prompt": "List the available experiments in my project.",
-            "tool_chain": "list_experiments",
-        },
-        {
-            "title": "Create a Simple Experiment",
-            "prompt": "Create a new experiment named 'test experiment' in my project",
-            "tool_chain": "create_experiment",
-        },
-    ]
+    return list(_DEMO_SCENARIOS)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,64 @@
+import pytest
+
+import analysis
+
+
+@pytest.mark.parametrize(
+    ("name", "description", "expected"),
+    [
+        ("llama-7b model=gpt2", None, "gpt2"),
+        ("mistral-7b", "llama2", "llama2"),
+        ("resnet", "model_name: bert/base", "bert/base"),
+        ("resnet", None, "resnet"),
+        (None, None, None),
+    ],
+)
+def test_extract_model_name_precedence(name, description, expected):
+    assert analysis._extract_model_name_impl(name, description) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("improved from 85% acc to accuracy: 92", 0.92),
+        ("91% f1", 0.91),
+        ("acc=0,85", 0.85),
+        ("resnet baseline", None),
+        (None, None),
+    ],
+)
+def test_extract_accuracy(text, expected):
+    assert analysis._extract_accuracy_impl(text) == expected
+
+
+def test_key_value_accuracy_passes_threshold():
+    reports = [
+        {
+            "experiment_id": "a",
+            "name": "improved from 85% acc to accuracy: 92",
+            "emissions": 1.0,
+        }
+    ]
+    result = analysis.select_lowest_consumption_experiment(reports, min_accuracy=90)
+    assert result["selected"]["experiment_id"] == "a"
+    assert result["selected"]["accuracy"] == 0.92
+
+
+@pytest.mark.parametrize(
+    ("name", "description", "expected"),
+    [
+        ("resnet accuracy:", "92", 0.92),
+        ("accuracy:", "92 and 85% f1", 0.92),
+        ("resnet 92", "% acc", 0.92),
+        ("85% acc", "accuracy: 92", 0.92),
+        ("acc=0.9", "accuracy: 80", 0.9),
+        ("resnet", "f1: 88", 0.88),
+        ("resnet", "baseline", None),
+        ("acc=0.7", None, 0.7),
+        (None, "91% f1", 0.91),
+    ],
+)
+def test_extract_accuracy_pair_matches_joined_text(name, description, expected):
+    joined = " ".join(part for part in (name, description) if part)
+    assert analysis.extract_accuracy_pair(name, description) == expected
+    assert analysis._extract_accuracy_impl(joined) == expected
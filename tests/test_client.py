@@ -0,0 +1,144 @@
+import asyncio
+
+import httpx
+
+from client import CodeCarbonApiClient
+
+
+def make_client(handler, **kwargs):
+    return CodeCarbonApiClient(
+        "https://api.example.test",
+        api_token="token",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def test_request_follows_redirects():
+    def handler(request):
+        if request.url.path == "/auth/check":
+            return httpx.Response(307, headers={"Location": "/v2/auth/check"})
+        return httpx.Response(200, json={"user": "me"})
+
+    async def run():
+        async with make_client(handler) as api:
+            return await api.check_auth()
+
+    assert asyncio.run(run()) == {"user": "me"}
+
+
+class RecordingHandler:
+    """MockTransport handler serving canned experiment listings."""
+
+    def __init__(self, experiments, etag='"v1"'):
+        self.experiments = experiments
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": "new"})
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json=self.experiments, headers={"ETag": self.etag})
+
+
+def test_fresh_cache_hit_makes_no_request():
+    handler = RecordingHandler([{"id": "e1", "name": "a"}])
+
+    async def run():
+        async with make_client(handler) as api:
+            first = await api.list_experiments("p1")
+            second = await api.list_experiments("p1")
+            return first, second
+
+    first, second = asyncio.run(run())
+    assert second is first
+    assert len(handler.requests) == 1
+    assert "If-None-Match" not in handler.requests[0].headers
+
+
+def test_stale_entry_revalidates_and_reuses_body_on_304():
+    handler = RecordingHandler([{"id": "e1", "name": "a"}])
+
+    async def run():
+        async with make_client(handler, cache_ttl_seconds=0) as api:
+            first = await api.list_experiments("p1")
+            first_index = await api.list_experiments_by_name("p1")
+            second = await api.list_experiments("p1")
+            second_index = await api.list_experiments_by_name("p1")
+            return first, second, first_index, second_index
+
+    first, second, first_index, second_index = asyncio.run(run())
+    assert handler.requests[1].headers["If-None-Match"] == '"v1"'
+    assert second is first
+    # The name index is reused while the listing object is unchanged
+    assert second_index is first_index
+
+
+def test_changed_listing_rebuilds_name_index():
+    handler = RecordingHandler([{"id": "e1", "name": "a"}])
+
+    async def run():
+        async with make_client(handler, cache_ttl_seconds=0) as api:
+            before = await api.list_experiments_by_name("p1")
+            handler.experiments = [{"id": "e2", "name": "B"}]
+            handler.etag = '"v2"'
+            after = await api.list_experiments_by_name("p1")
+            return before, after
+
+    before, after = asyncio.run(run())
+    assert list(before) == ["a"]
+    assert list(after) == ["b"]
+
+
+def test_create_experiment_invalidates_project_listing():
+    handler = RecordingHandler([{"id": "e1", "name": "a"}])
+
+    async def run():
+        async with make_client(handler) as api:
+            await api.list_experiments("p1")
+            await api.list_experiments("p2")
+            await api.create_experiment(project_id="p1", name="b")
+            await api.list_experiments("p1")
+            await api.list_experiments("p2")
+
+    asyncio.run(run())
+    gets = [r.url.path for r in handler.requests if r.method == "GET"]
+    assert gets == [
+        "/projects/p1/experiments",
+        "/projects/p2/experiments",
+        "/projects/p1/experiments",
+    ]
+    # The invalidated entry is dropped, not revalidated
+    assert "If-None-Match" not in handler.requests[-1].headers
+
+
+def test_set_token_invalidates_all_listings():
+    handler = RecordingHandler([])
+
+    async def run():
+        async with make_client(handler) as api:
+            await api.list_organizations()
+            api.set_token(access_token="other")
+            await api.list_organizations()
+
+    asyncio.run(run())
+    assert len(handler.requests) == 2
+    assert handler.requests[1].headers["Authorization"] == "Bearer other"
+    assert "x-api-token" not in handler.requests[1].headers
+
+
+def test_name_index_tolerates_missing_names():
+    handler = RecordingHandler(
+        [{"id": "e1", "name": None}, {"id": "e2"}, {"id": "e3", "name": " Run "}]
+    )
+
+    async def run():
+        async with make_client(handler) as api:
+            return await api.list_experiments_by_name("p1")
+
+    index = asyncio.run(run())
+    assert [e["id"] for e in index[""]] == ["e1", "e2"]
+    assert [e["id"] for e in index["run"]] == ["e3"]
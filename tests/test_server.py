@@ -0,0 +1,242 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import types
+
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+
+import server
+
+
+class StubEmissionsTracker:
+    """Stand-in for codecarbon's EmissionsTracker that touches no hardware."""
+
+    instances = 0
+
+    def __init__(self, **kwargs):
+        StubEmissionsTracker.instances += 1
+        self.kwargs = kwargs
+
+    def start(self):
+        pass
+
+    def stop(self):
+        return 0.25
+
+
+@pytest.fixture(autouse=True)
+def stub_codecarbon(monkeypatch):
+    StubEmissionsTracker.instances = 0
+    monkeypatch.setitem(
+        sys.modules,
+        "codecarbon",
+        types.SimpleNamespace(EmissionsTracker=StubEmissionsTracker),
+    )
+    monkeypatch.setattr(server, "_session", None)
+    monkeypatch.setattr(server, "_tracker_lock", asyncio.Lock())
+
+
+def payload(result):
+    """Decode the JSON payload of a FastMCP call_tool result.
+
+    FastMCP validates the return value against the tool's output schema
+    before returning, so a successful call also means the payload matched
+    its declared TypedDict. The text content is the payload as returned.
+    """
+    content, _ = result
+    return json.loads(content[0].text)
+
+
+def call_tool(name, arguments=None):
+    """Invoke a tool through FastMCP and return its decoded payload."""
+    return payload(asyncio.run(server.mcp.call_tool(name, arguments or {})))
+
+
+def test_get_status_without_session():
+    assert call_tool("get_status") == {"status": "not_tracking"}
+
+
+def test_tracking_lifecycle():
+    started = call_tool("start_tracking", {"measure_power_secs": 5})
+    assert started["status"] == "started"
+    assert started["project_name"] == "mcp-codecarbon-tracking"
+    assert started["measurement_interval"] == 5
+    assert "message" not in started
+
+    status = call_tool("get_status")
+    assert status == {"status": "tracking", "start_time": started["start_time"]}
+
+    metrics = call_tool("get_current_metrics")
+    assert metrics["status"] == "tracking"
+    assert metrics["start_time"] == started["start_time"]
+    assert metrics["duration_seconds"] >= 0
+
+    stopped = call_tool("stop_tracking")
+    assert stopped["status"] == "stopped"
+    assert stopped["emissions_kg_co2"] == 0.25
+    assert call_tool("get_status") == {"status": "not_tracking"}
+
+
+def test_codecarbon_imported_off_event_loop(monkeypatch):
+    import_threads = []
+    module = types.ModuleType("codecarbon")
+
+    def module_getattr(name):
+        if name != "EmissionsTracker":
+            raise AttributeError(name)
+        import_threads.append(threading.current_thread())
+        return StubEmissionsTracker
+
+    module.__getattr__ = module_getattr
+    monkeypatch.setitem(sys.modules, "codecarbon", module)
+
+    assert call_tool("start_tracking")["status"] == "started"
+    assert import_threads
+    assert threading.main_thread() not in import_threads
+
+
+def test_start_tracking_when_already_running():
+    call_tool("start_tracking")
+    again = call_tool("start_tracking")
+    assert again == {
+        "status": "already_running",
+        "message": "Tracking is already in progress.",
+    }
+    assert StubEmissionsTracker.instances == 1
+
+
+def test_concurrent_start_creates_single_tracker():
+    async def start_many():
+        return await asyncio.gather(
+            *(server.mcp.call_tool("start_tracking", {}) for _ in range(5))
+        )
+
+    results = asyncio.run(start_many())
+    statuses = sorted(payload(result)["status"] for result in results)
+    assert statuses == ["already_running"] * 4 + ["started"]
+    assert StubEmissionsTracker.instances == 1
+
+
+def test_stop_and_metrics_without_session_fail():
+    with pytest.raises(ToolError, match="No active tracking session"):
+        call_tool("stop_tracking")
+    with pytest.raises(ToolError, match="No active tracking session"):
+        call_tool("get_current_metrics")
+
+
+def test_replaced_client_closed_after_last_lease(tmp_path, monkeypatch):
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text(json.dumps({"tokens": {"access_token": "first"}}))
+    monkeypatch.setattr(server, "_CREDENTIALS_FILE", str(credentials))
+    monkeypatch.setattr(server, "_client_cache", None)
+    monkeypatch.setattr(server, "_client_mtime", None)
+
+    async def run():
+        async with server._api_client() as old:
+            # Simulate `codecarbon login` while a tool call holds the client
+            credentials.write_text(json.dumps({"tokens": {"access_token": "second"}}))
+            stat = credentials.stat()
+            os.utime(credentials, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            async with server._api_client() as new:
+                assert new is not old
+                assert new.access_token == "second"
+            assert not old._http.is_closed
+        assert old._http.is_closed
+        assert not new._http.is_closed
+        await new.aclose()
+
+    asyncio.run(run())
+
+
+class FakeApiClient:
+    """Stand-in for CodeCarbonApiClient that answers from memory."""
+
+    async def list_experiments(self, project_id):
+        # Later projects answer first, so completion order differs from input
+        await asyncio.sleep(0.01 / int(project_id.lstrip("p") or 1))
+        if project_id == "p404":
+            raise ValueError("project not found")
+        return [{"id": f"{project_id}-exp"}]
+
+    async def get_experiment(self, experiment_id):
+        return {"id": experiment_id, "name": "exp"}
+
+    async def get_experiment_run_summaries(self, experiment_id, **kwargs):
+        return [{"emissions": 1.0}]
+
+    async def get_project_experiment_summaries(self, project_id, **kwargs):
+        return [
+            {"experiment_id": "low", "name": "acc=0.8", "emissions": 1.0},
+            {"experiment_id": "high", "name": "acc=0.95", "emissions": 2.0},
+        ]
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    fake = FakeApiClient()
+    monkeypatch.setattr(server, "_client_cache", fake)
+    monkeypatch.setattr(server, "_build_client", lambda: fake)
+    return fake
+
+
+def batch(operations, **kwargs):
+    return asyncio.run(server.batch_execute(operations, **kwargs))
+
+
+def test_batch_execute_preserves_order(fake_api):
+    projects = ["p1", "p2", "p3", "p4"]
+    results = batch([{"tool": "list_experiments", "args": {"project_id": p}} for p in projects])
+    assert [r["status"] for r in results] == ["ok"] * 4
+    assert [r["result"][0]["id"] for r in results] == [f"{p}-exp" for p in projects]
+
+
+def test_batch_execute_validates_arguments_like_direct_calls(fake_api):
+    recommended, consumption = batch(
+        [
+            {
+                "tool": "recommend_lowest_emission_experiment",
+                "args": {"project_id": "p1", "min_accuracy": "92"},
+            },
+            {
+                "tool": "get_experiment_consumption",
+                "args": {"experiment_id": "e1", "include_runs": "false"},
+            },
+        ]
+    )
+    assert recommended["status"] == "ok"
+    assert recommended["result"]["recommendation"]["selected"]["experiment_id"] == "high"
+    assert consumption["status"] == "ok"
+    assert "runs" not in consumption["result"]
+
+
+def test_batch_execute_reports_errors(fake_api):
+    results = batch(
+        [
+            {"tool": "list_experiments", "args": {"project_id": "p404"}},
+            {"tool": "list_experiments", "args": {}},
+            {"tool": "start_tracking"},
+            {"tool": "list_experiments", "args": {"project_id": "p1"}},
+        ]
+    )
+    assert [r["status"] for r in results] == ["error", "error", "error", "ok"]
+    assert results[0]["error"] == "ValueError: project not found"
+    assert results[1]["error"].startswith("ValidationError")
+    assert "Unknown or non-batchable tool 'start_tracking'" in results[2]["error"]
+    assert "result" not in results[0]
+
+
+def test_batch_execute_stop_on_error_skips_pending(fake_api):
+    operations = [
+        {"tool": "list_experiments", "args": {"project_id": "p1"}},
+        {"tool": "list_experiments", "args": {"project_id": "p404"}},
+        {"tool": "list_experiments", "args": {"project_id": "p2"}},
+    ]
+    results = batch(operations, max_concurrent=1, stop_on_error=True)
+    assert [r["status"] for r in results] == ["ok", "error", "skipped"]
+    assert results[2] == {"tool": "list_experiments", "status": "skipped"}
+
+    results = batch(operations, max_concurrent=1)
+    assert [r["status"] for r in results] == ["ok", "error", "ok"]